@@ -5,52 +5,249 @@ A simple console-based application to track daily expenses
 """
 
 import csv
+import io
+import locale
+import math
 import os
-from datetime import datetime
+import sys
+from array import array
+from bisect import bisect_left
 
 # Global variables
 EXPENSE_FILE = 'expenses.csv'
+IO_BUFFER_SIZE = 1 << 20  # 1 MiB, keeps full rewrites from issuing many small writes
+FIELDS = ['date', 'category', 'description', 'amount']
 CATEGORIES = ['Food', 'Transport', 'Entertainment', 'Bills', 'Shopping', 'Health', 'Other']
+CAT_TO_IDX = {c: i for i, c in enumerate(CATEGORIES)}
+
+# Static screen text, built once at import
+HEADER = "=" * 60 + "\n           PERSONAL EXPENSE TRACKER\n" + "=" * 60 + "\n\n"
+CATEGORY_MENU = "\n".join(f"  {i}. {category}" for i, category in enumerate(CATEGORIES, 1))
+MAIN_MENU = "\n".join([
+    "MAIN MENU",
+    "-" * 60,
+    "1. Add Expense",
+    "2. View All Expenses",
+    "3. View Expenses by Category",
+    "4. View Summary",
+    "5. Delete Expense",
+    "6. Save and Exit",
+    "-" * 60,
+])
+
+# Row formatters for expense listings: (#, date, category, description, amount)
+# and (#, date, description, amount)
+ROW_FMT = "{:<5} {:<12} {:<15} {:<20} ₹{:>9.2f}".format
+CATEGORY_ROW_FMT = "{:<5} {:<12} {:<30} ₹{:>9.2f}".format
+
+class ExpenseBook:
+    """Expenses stored column-wise, with running per-category counts and totals.
+
+    Categories are stored as small integer ids. Ids 0-6 are CATEGORIES in
+    order; any other category names found in the file get ids after those.
+    """
+
+    def __init__(self):
+        self.dates = []
+        self.cat_ids = array('H')  # Room for names outside CATEGORIES found in the file
+        self.descriptions = []
+        self.amounts = array('d')
+        self.category_names = list(CATEGORIES)
+        self.category_ids = dict(CAT_TO_IDX)
+        self.cat_count = [0] * len(CATEGORIES)
+        self.cat_total = array('d', [0.0] * len(CATEGORIES))
+        self.cat_index = [[] for _ in CATEGORIES]  # Sorted row indices per category id
+        self.total = 0.0
+        self.deleted = set()  # Storage indices of deleted rows, dropped by compact()
+        self.dirty = False  # True once the file needs a full rewrite
+        self.encoding = 'utf-8'  # Encoding of the expense file, kept for appends and rewrites
+        self.load_failed = False  # True if the file could not be read; it is then never written
+
+    def __len__(self):
+        return len(self.amounts) - len(self.deleted)
+
+    def __iter__(self):
+        """Yield (date, category, description, amount) rows, skipping deleted ones"""
+        categories = map(self.category_names.__getitem__, self.cat_ids)
+        rows = zip(self.dates, categories, self.descriptions, self.amounts)
+        if not self.deleted:
+            return rows
+        deleted = self.deleted
+        return (row for i, row in enumerate(rows) if i not in deleted)
+
+    def category_id(self, category):
+        """Return the id for a category name, registering names outside CATEGORIES"""
+        cid = self.category_ids.get(category)
+        if cid is None:
+            cid = self.category_ids[category] = len(self.category_names)
+            self.category_names.append(category)
+            self.cat_count.append(0)
+            self.cat_total.append(0.0)
+            self.cat_index.append([])
+        return cid
+
+    def add(self, date, category, description, amount):
+        """Append an expense and fold it into the totals"""
+        cid = self.category_id(category)
+        index = len(self.amounts)
+        # Columns first, so a failed append can't leave a dangling index entry
+        self.cat_ids.append(cid)
+        self.dates.append(date)
+        self.descriptions.append(description)
+        self.amounts.append(amount)
+        self.cat_index[cid].append(index)
+        self.total += amount
+        self.cat_count[cid] += 1
+        self.cat_total[cid] += amount
+
+    def row_ids(self):
+        """Return the storage indices of the rows that have not been deleted, in order"""
+        deleted = self.deleted
+        return [i for i in range(len(self.amounts)) if i not in deleted]
+
+    def delete(self, index):
+        """Tombstone the row at storage index, take it out of the totals and return it.
+
+        The row stays in the columns until compact(), so no other index moves.
+        """
+        cid = self.cat_ids[index]
+        amount = self.amounts[index]
+        self.deleted.add(index)
+        self.dirty = True
+        self.cat_count[cid] -= 1
+        rows = self.cat_index[cid]
+        del rows[bisect_left(rows, index)]
+        # Re-sum rather than subtract, so repeated deletes don't leave rounding residue
+        # (e.g. a "-0.00" total once everything is gone)
+        amounts = self.amounts
+        self.cat_total[cid] = math.fsum(amounts[i] for i in rows)
+        self.total = math.fsum(self.cat_total)
+        return self.dates[index], self.category_names[cid], self.descriptions[index], amount
+
+    def compact(self):
+        """Drop tombstoned rows from the columns and rebuild the category index"""
+        if not self.deleted:
+            return
+        keep = self.row_ids()
+        self.dates = [self.dates[i] for i in keep]
+        self.cat_ids = array('H', [self.cat_ids[i] for i in keep])
+        self.descriptions = [self.descriptions[i] for i in keep]
+        self.amounts = array('d', [self.amounts[i] for i in keep])
+        self.cat_index = [[] for _ in self.category_names]
+        for i, cid in enumerate(self.cat_ids):
+            self.cat_index[cid].append(i)
+        self.deleted.clear()
 
 def clear_screen():
     """Clear the console screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if sys.stdout.isatty():
+        # ANSI clear + cursor home, avoids spawning a shell on every redraw
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+    else:
+        os.system('cls' if os.name == 'nt' else 'clear')
 
 def print_header():
     """Print application header"""
-    print("=" * 60)
-    print("           PERSONAL EXPENSE TRACKER")
-    print("=" * 60)
-    print()
+    sys.stdout.write(HEADER)
 
 def load_expenses():
     """Load expenses from CSV file"""
-    expenses = []
+    expenses = ExpenseBook()
     if os.path.exists(EXPENSE_FILE):
         try:
-            with open(EXPENSE_FILE, 'r', newline='') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    expenses.append(row)
+            with open(EXPENSE_FILE, 'rb') as file:
+                data = file.read()
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                # Older files were written in the locale encoding
+                expenses.encoding = locale.getpreferredencoding(False)
+                text = data.decode(expenses.encoding)
+            rows = None
+            if '"' not in text:
+                # Descriptions never contain commas or quotes, so a plain split is safe.
+                # Only '\n' ends a row, like in csv; str.splitlines() would also split
+                # on characters such as U+2028 that may appear inside a description.
+                rows = [line.rstrip('\r').split(',') for line in text.split('\n')]
+                rows = [row for row in rows if row != ['']]
+                if any(len(row) != len(FIELDS) for row in rows):
+                    rows = None
+            if rows is None:
+                # Quoted fields (older files) or odd rows need the csv module
+                rows = csv.reader(io.StringIO(text, newline=''))
+            rows = iter(rows)
+            next(rows, None)  # Skip header
+            for row in rows:
+                if not row:
+                    continue  # Blank line
+                date, category, description, amount = row
+                expenses.add(date, category, description, float(amount))
             print(f"✓ Loaded {len(expenses)} expenses from file.")
         except Exception as e:
+            expenses.load_failed = True
             print(f"Error loading expenses: {e}")
+            print("The expense file will not be changed during this session.")
     else:
         print("No existing expense file found. Starting fresh.")
     return expenses
 
 def save_expenses(expenses):
-    """Save expenses to CSV file"""
+    """Rewrite the CSV file from the in-memory expenses"""
+    if expenses.load_failed:
+        print("Expense file could not be loaded; not overwriting it.")
+        return
     try:
-        with open(EXPENSE_FILE, 'w', newline='') as file:
-            fieldnames = ['date', 'category', 'description', 'amount']
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(expenses)
+        # Format all rows in memory, then write them out in one call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(FIELDS)
+        writer.writerows(expenses)
+        with open(EXPENSE_FILE, 'w', newline='', encoding=expenses.encoding,
+                  buffering=IO_BUFFER_SIZE) as file:
+            file.write(buffer.getvalue())
+        expenses.compact()
+        expenses.dirty = False
         print("✓ Expenses saved successfully!")
     except Exception as e:
         print(f"Error saving expenses: {e}")
 
+def append_expense_row(expenses, row):
+    """Append a single (date, category, description, amount) row to the CSV file.
+
+    Returns True if the row reached the file. On a write error the book is
+    marked dirty so the full rewrite on exit retries it.
+    """
+    if expenses.load_failed:
+        return False
+    try:
+        size = os.path.getsize(EXPENSE_FILE) if os.path.exists(EXPENSE_FILE) else 0
+        missing_newline = False
+        if size:
+            # Hand-edited files may not end with a newline; don't glue the row onto the last line
+            with open(EXPENSE_FILE, 'rb') as file:
+                file.seek(-1, os.SEEK_END)
+                missing_newline = file.read(1) != b'\n'
+        with open(EXPENSE_FILE, 'a', newline='', encoding=expenses.encoding) as file:
+            writer = csv.writer(file)
+            if missing_newline:
+                file.write(writer.dialect.lineterminator)
+            if not size:
+                writer.writerow(FIELDS)
+            writer.writerow(row)
+        return True
+    except Exception as e:
+        print(f"Error saving expense: {e}")
+        expenses.dirty = True
+        return False
+
+def print_expense_rows(expenses):
+    """Print a numbered line per expense with a single write"""
+    lines = [ROW_FMT(i, date, category, description[:20], amount)
+             for i, (date, category, description, amount) in enumerate(expenses, 1)]
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
+
 def add_expense(expenses):
     """Add a new expense"""
     clear_screen()
@@ -58,14 +255,14 @@ def add_expense(expenses):
     print("ADD NEW EXPENSE")
     print("-" * 60)
 
-    # Get current date
+    # Get current date (datetime is only needed here, so import it lazily)
+    from datetime import datetime
     date = datetime.now().strftime('%Y-%m-%d')
     print(f"Date: {date}")
 
     # Show categories
     print("\nCategories:")
-    for i, category in enumerate(CATEGORIES, 1):
-        print(f"  {i}. {category}")
+    print(CATEGORY_MENU)
 
     # Get category
     while True:
@@ -80,7 +277,12 @@ def add_expense(expenses):
             print("Invalid input. Please enter a number.")
 
     # Get description
-    description = input("Description: ").strip()
+    while True:
+        description = input("Description: ").strip()
+        if ',' in description or '"' in description:
+            print("Description cannot contain commas or quotes.")
+        else:
+            break
     if not description:
         description = "No description"
 
@@ -96,15 +298,14 @@ def add_expense(expenses):
             print("Invalid amount. Please enter a number.")
 
     # Add expense
-    expense = {
-        'date': date,
-        'category': category,
-        'description': description,
-        'amount': str(amount)
-    }
-    expenses.append(expense)
-
-    print(f"\n✓ Expense added successfully!")
+    expenses.add(date, category, description, amount)
+    if append_expense_row(expenses, (date, category, description, amount)):
+        print(f"\n✓ Expense added successfully!")
+    elif expenses.load_failed:
+        print("\nExpense added for this session only; the expense file could not be loaded, "
+              "so it will not be saved.")
+    else:
+        print("\nExpense kept in memory; saving it will be retried on exit.")
     print(f"  Category: {category}")
     print(f"  Description: {description}")
     print(f"  Amount: ₹{amount:.2f}")
@@ -125,13 +326,10 @@ def view_all_expenses(expenses):
         print(f"{'#':<5} {'Date':<12} {'Category':<15} {'Description':<20} {'Amount':>10}")
         print("-" * 60)
 
-        for i, expense in enumerate(expenses, 1):
-            print(f"{i:<5} {expense['date']:<12} {expense['category']:<15} "
-                  f"{expense['description'][:20]:<20} ₹{float(expense['amount']):>9.2f}")
+        print_expense_rows(expenses)
 
         print("-" * 60)
-        total = sum(float(e['amount']) for e in expenses)
-        print(f"{'Total:':<52} ₹{total:>9.2f}")
+        print(f"{'Total:':<52} ₹{expenses.total:>9.2f}")
 
     input("\nPress Enter to continue...")
 
@@ -149,10 +347,9 @@ def view_by_category(expenses):
 
     # Show categories with counts
     print("Categories:")
-    for i, category in enumerate(CATEGORIES, 1):
-        count = sum(1 for e in expenses if e['category'] == category)
-        total = sum(float(e['amount']) for e in expenses if e['category'] == category)
-        print(f"  {i}. {category:<15} ({count} expenses, ₹{total:.2f})")
+    for cid, category in enumerate(CATEGORIES):
+        print(f"  {cid + 1}. {category:<15} ({expenses.cat_count[cid]} expenses, "
+              f"₹{expenses.cat_total[cid]:.2f})")
 
     # Get category choice
     while True:
@@ -167,7 +364,8 @@ def view_by_category(expenses):
             print("Invalid input. Please enter a number.")
 
     # Filter and display
-    filtered = [e for e in expenses if e['category'] == selected_category]
+    selected_id = CAT_TO_IDX[selected_category]
+    filtered = expenses.cat_index[selected_id]
 
     print(f"\n{selected_category.upper()} EXPENSES")
     print("-" * 60)
@@ -178,13 +376,14 @@ def view_by_category(expenses):
         print(f"{'#':<5} {'Date':<12} {'Description':<30} {'Amount':>10}")
         print("-" * 60)
 
-        for i, expense in enumerate(filtered, 1):
-            print(f"{i:<5} {expense['date']:<12} {expense['description'][:30]:<30} "
-                  f"₹{float(expense['amount']):>9.2f}")
+        dates, descriptions, amounts = expenses.dates, expenses.descriptions, expenses.amounts
+        lines = [CATEGORY_ROW_FMT(i, dates[row], descriptions[row][:30], amounts[row])
+                 for i, row in enumerate(filtered, 1)]
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
 
         print("-" * 60)
-        total = sum(float(e['amount']) for e in filtered)
-        print(f"{'Total:':<47} ₹{total:>9.2f}")
+        print(f"{'Total:':<47} ₹{expenses.cat_total[selected_id]:>9.2f}")
 
     input("\nPress Enter to continue...")
 
@@ -199,7 +398,7 @@ def view_summary(expenses):
         print("No expenses recorded yet.")
     else:
         # Overall total
-        total = sum(float(e['amount']) for e in expenses)
+        total = expenses.total
         print(f"Total Expenses: ₹{total:.2f}")
         print(f"Number of Transactions: {len(expenses)}")
         print(f"Average per Transaction: ₹{total/len(expenses):.2f}")
@@ -209,11 +408,10 @@ def view_summary(expenses):
         print(f"{'Category':<20} {'Count':>8} {'Amount':>12} {'Percentage':>12}")
         print("-" * 60)
 
-        for category in CATEGORIES:
-            category_expenses = [e for e in expenses if e['category'] == category]
-            if category_expenses:
-                count = len(category_expenses)
-                amount = sum(float(e['amount']) for e in category_expenses)
+        for cid, category in enumerate(CATEGORIES):
+            count = expenses.cat_count[cid]
+            if count:
+                amount = expenses.cat_total[cid]
                 percentage = (amount / total) * 100
                 print(f"{category:<20} {count:>8} ₹{amount:>11.2f} {percentage:>11.1f}%")
 
@@ -237,9 +435,8 @@ def delete_expense(expenses):
     print(f"{'#':<5} {'Date':<12} {'Category':<15} {'Description':<20} {'Amount':>10}")
     print("-" * 60)
 
-    for i, expense in enumerate(expenses, 1):
-        print(f"{i:<5} {expense['date']:<12} {expense['category']:<15} "
-              f"{expense['description'][:20]:<20} ₹{float(expense['amount']):>9.2f}")
+    print_expense_rows(expenses)
+    row_ids = expenses.row_ids()
 
     # Get expense to delete
     while True:
@@ -250,8 +447,8 @@ def delete_expense(expenses):
 
             choice = int(choice)
             if 1 <= choice <= len(expenses):
-                deleted = expenses.pop(choice - 1)
-                print(f"\n✓ Deleted expense: {deleted['description']} (₹{deleted['amount']})")
+                _, _, description, amount = expenses.delete(row_ids[choice - 1])
+                print(f"\n✓ Deleted expense: {description} (₹{amount:.2f})")
                 break
             else:
                 print(f"Invalid choice. Please enter a number between 1 and {len(expenses)}.")
@@ -264,21 +461,16 @@ def delete_expense(expenses):
 def main_menu():
     """Display main menu"""
     print_header()
-    print("MAIN MENU")
-    print("-" * 60)
-    print("1. Add Expense")
-    print("2. View All Expenses")
-    print("3. View Expenses by Category")
-    print("4. View Summary")
-    print("5. Delete Expense")
-    print("6. Save and Exit")
-    print("-" * 60)
+    print(MAIN_MENU)
 
     choice = input("Enter your choice (1-6): ")
     return choice
 
 def main():
     """Main application loop"""
+    if os.name == 'nt':
+        os.system('')  # Enables ANSI escape handling in the Windows console
+
     clear_screen()
     print_header()
     print("Welcome to Personal Expense Tracker!")
@@ -304,11 +496,18 @@ def main():
         elif choice == '5':
             expenses = delete_expense(expenses)
         elif choice == '6':
-            save_expenses(expenses)
+            # Adds are already on disk; only deletions or failed appends need a rewrite
+            if expenses.dirty:
+                save_expenses(expenses)
             clear_screen()
             print_header()
             print("Thank you for using Personal Expense Tracker!")
-            print("Your expenses have been saved.")
+            if expenses.load_failed:
+                print("Your expenses were not saved because the expense file could not be loaded.")
+            elif expenses.dirty:
+                print("Some changes could not be saved to the expense file.")
+            else:
+                print("Your expenses have been saved.")
             print()
             break
         else: